@@ -0,0 +1,21 @@
+import os
+import sys
+
+from google.protobuf.internal import api_implementation
+
+
+# include current directory to fix relative import in genrated grpc files
+sys.path.append(
+    os.path.abspath(
+        os.path.join(os.path.split(__file__)[0], ".")
+    )
+)
+
+# the proxy messages are parsed and built on every RPC, refuse to run them on
+# the pure-python protobuf backend which is an order of magnitude slower than
+# the upb/cpp ones
+if api_implementation.Type() not in ("upb", "cpp"):
+    raise ImportError(
+        "protobuf python backend %s is not supported, install protobuf>=4.21 "
+        "or unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION" %
+        api_implementation.Type())